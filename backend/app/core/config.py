@@ -69,6 +69,10 @@ class Settings(BaseSettings):
     # BigQuery settings
     BIGQUERY_DATASET: str = Field(default="clausecompass", description="BigQuery dataset")
     BIGQUERY_TABLE: str = Field(default="events", description="BigQuery events table")
+    ANALYTICS_TYPED_COLUMNS: bool = Field(
+        default=False,
+        description="Publish hot analytics fields as typed top-level columns (requires the events_typed_columns migration)"
+    )
     
     # Pub/Sub settings
     PUBSUB_TOPIC: str = Field(default="clausecompass-events", description="Pub/Sub topic")
@@ -77,6 +81,7 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE_MB: int = Field(default=10, description="Maximum file size in MB")
     MAX_PAGES: int = Field(default=10, description="Maximum document pages")
     MAX_CLAUSES_PER_BATCH: int = Field(default=10, description="Max clauses per batch")
+    MIN_CLAUSE_CHARS: int = Field(default=25, description="Minimum clause length (chars) to send for AI summarization")
     MAX_BATCH_SIZE: int = Field(default=10, description="Maximum number of files in batch upload")
     DEFAULT_BATCH_CONCURRENCY: int = Field(default=3, description="Default concurrency for batch processing")
     
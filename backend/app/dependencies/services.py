@@ -7,7 +7,7 @@ from typing import Optional
 
 from app.services.firestore_client import FirestoreClient
 from app.services.embeddings_service import EmbeddingsService
-from app.services.gemini_client import GeminiClient
+from app.services.gemini_client import GeminiClient, get_shared_gemini_client
 from app.services.chat_session_service import ChatSessionService
 from app.services.cache_service import InMemoryCache, get_cache
 from app.services.document_orchestrator import DocumentOrchestrator
@@ -68,7 +68,7 @@ def get_gemini_client() -> GeminiClient:
     global _gemini_client
     if _gemini_client is None:
         logger.info("Initializing singleton Gemini client")
-        _gemini_client = GeminiClient()
+        _gemini_client = get_shared_gemini_client()
     return _gemini_client
 
 
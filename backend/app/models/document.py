@@ -37,6 +37,14 @@ class RiskLevel(str, Enum):
     MODERATE = "moderate"
     ATTENTION = "attention"
 
+    @property
+    def value_int(self) -> int:
+        """Ordinal for array-indexed aggregation (LOW=0, MODERATE=1, ATTENTION=2)."""
+        return _RISK_LEVEL_ORDINALS[self]
+
+
+_RISK_LEVEL_ORDINALS = {RiskLevel.LOW: 0, RiskLevel.MODERATE: 1, RiskLevel.ATTENTION: 2}
+
 
 class DocumentUploadResponse(BaseModel):
     """Response model for document upload."""
@@ -5,7 +5,7 @@ These models define the structure for metrics data retrieved from BigQuery
 and served via the /api/v1/metrics endpoints.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -29,7 +29,7 @@ class MetricsSummary(BaseModel):
     
     period_start: datetime = Field(description="Start of metrics period")
     period_end: datetime = Field(description="End of metrics period")
-    last_updated: datetime = Field(default_factory=datetime.utcnow, description="Timestamp of last update")
+    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp of last update")
 
 
 class TrendDataPoint(BaseModel):
@@ -95,4 +95,4 @@ class MetricsDetails(BaseModel):
     recent_documents: List[Dict] = Field(description="Recent document uploads (last 10)")
     recent_high_risks: List[Dict] = Field(description="Recent high-risk detections (last 10)")
     
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
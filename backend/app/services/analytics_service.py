@@ -48,6 +48,7 @@ class AnalyticsService:
         - multiplier: 2.0 (exponential backoff)
         """
         settings = get_settings()
+        self._typed_columns_enabled = settings.ANALYTICS_TYPED_COLUMNS
         
         batch_settings = pubsub_v1.types.BatchSettings(
             max_messages=10,  # Batch up to 10 messages
@@ -121,7 +122,29 @@ class AnalyticsService:
             # not a nested object. Double-encode event_data for BigQuery compatibility.
             # See: https://cloud.google.com/pubsub/docs/bigquery#json_columns
             if "event_data" in event_dict and event_dict["event_data"] is not None:
-                event_dict["event_data"] = json.dumps(event_dict["event_data"])
+                payload = event_dict["event_data"]
+                
+                # Promote the hot analytics fields to top-level typed columns
+                # so dashboard queries read them without per-row JSON parsing.
+                # Gated off by default: the Pub/Sub->BigQuery subscription
+                # rejects unknown fields, so enable ANALYTICS_TYPED_COLUMNS
+                # only AFTER running sql/events_typed_columns.sql and
+                # repointing the subscription — otherwise every enriched
+                # event lands in the DLQ. The full payload stays in
+                # event_data either way.
+                if self._typed_columns_enabled:
+                    for field in (
+                        "risk_level",
+                        "category",
+                        "risk_score",
+                        "processing_time_ms",
+                        "response_time_ms",
+                        "answer_confidence",
+                    ):
+                        if payload.get(field) is not None:
+                            event_dict[field] = payload[field]
+                
+                event_dict["event_data"] = json.dumps(payload)
             
             message_data = json.dumps(event_dict).encode("utf-8")
             
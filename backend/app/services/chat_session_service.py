@@ -19,7 +19,7 @@ from app.models.chat import (
     AddMessageRequest
 )
 from app.services.firestore_client import FirestoreClient, FirestoreError
-from app.services.gemini_client import GeminiClient
+from app.services.gemini_client import GeminiClient, get_shared_gemini_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class ChatSessionService:
     
     def __init__(self):
         self.firestore_client = FirestoreClient()
-        self.gemini_client = GeminiClient()
+        self.gemini_client = get_shared_gemini_client()
         self.settings = get_settings()
         
         # Collection names
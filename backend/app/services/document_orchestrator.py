@@ -14,7 +14,7 @@ from app.services.analytics_service import get_analytics_service
 from app.services.document_processor_grpc import DocumentProcessorGRPC, DocumentProcessingError
 from app.services.document_processor_http import DocumentProcessor as DocumentProcessorHTTP
 from app.services.clause_segmenter import ClauseSegmenter, ClauseCandidate
-from app.services.gemini_client import GeminiClient, GeminiError
+from app.services.gemini_client import GeminiClient, GeminiError, get_shared_gemini_client
 from app.services.firestore_client import FirestoreClient, FirestoreError
 from app.services.privacy_service import PrivacyService
 from app.services.risk_analyzer import RiskAnalyzer, RiskAssessment
@@ -32,7 +32,7 @@ class DocumentOrchestrator:
         self.document_processor = DocumentProcessorGRPC()
         self.document_processor_http = DocumentProcessorHTTP()
         self.clause_segmenter = ClauseSegmenter()
-        self.gemini_client = GeminiClient()
+        self.gemini_client = get_shared_gemini_client()
         self.firestore_client = FirestoreClient()
         self.privacy_service = PrivacyService()
         self.risk_analyzer = RiskAnalyzer()
@@ -161,7 +161,7 @@ class DocumentOrchestrator:
                 
                 # Stage 4: Gemini Summarization
                 logger.info(f"Stage 4: AI summarization (language: {language.value})")
-                summarization_results = await self.gemini_client.batch_summarize_clauses(
+                summarization_results = await self.gemini_client.batch_summarize_clauses_list(
                     clause_candidates, include_negotiation_tips=True, language=language
                 )
                 processing_result["stages_completed"].append("ai_summarization")
@@ -172,28 +172,29 @@ class DocumentOrchestrator:
                 # Stages 5 & 6: Risk Analysis and Readability Comparison (Concurrent)
                 logger.info("Stages 5 & 6: Risk analysis and readability analysis (concurrent)")
                 
-                # Create parallel tasks for risk analysis
-                risk_tasks = []
-                for i, (clause, summary_result) in enumerate(zip(clause_candidates, summarization_results)):
-                    task = self.risk_analyzer.analyze_clause_risk(
+                # Batch the risk inputs; the analyzer fans the CPU-bound
+                # keyword scans out to worker threads itself
+                risk_inputs = [
+                    (
                         clause.text,
-                        summary_result.get("summary"),
-                        summary_result.get("risk_level"),
-                        summary_result.get("category")
+                        summary_result.summary,
+                        summary_result.risk_level,
+                        summary_result.category,
                     )
-                    risk_tasks.append(task)
+                    for clause, summary_result in zip(clause_candidates, summarization_results)
+                ]
                 
                 # Create parallel tasks for readability analysis
                 readability_tasks = []
                 for clause, summary_result in zip(clause_candidates, summarization_results):
                     task = self.readability_service.compare_readability(
-                        clause.text, summary_result.get("summary", "")
+                        clause.text, summary_result.summary
                     )
                     readability_tasks.append(task)
                 
                 # Execute both risk and readability analyses concurrently
                 risk_assessments, readability_comparisons = await asyncio.gather(
-                    asyncio.gather(*risk_tasks),
+                    self.risk_analyzer.analyze_clauses(risk_inputs),
                     asyncio.gather(*readability_tasks)
                 )
                 
@@ -210,8 +211,8 @@ class DocumentOrchestrator:
                         "clause_id": f"{doc_id}_clause_{i}",
                         "order": i + 1,
                         "original_text": clause.text,  # This is already masked
-                        "summary": summary_result.get("summary", ""),
-                        "category": summary_result.get("category", "Other"),
+                        "summary": summary_result.summary,
+                        "category": summary_result.category,
                         "language": language.value,
                         "risk_level": risk_assessment.risk_level.value,
                         "needs_review": risk_assessment.needs_review,
@@ -221,9 +222,9 @@ class DocumentOrchestrator:
                             "delta": readability_comp["improvements"]["grade_level_delta"],
                             "flesch_score": readability_comp["simplified"]["flesch_reading_ease"]
                         },
-                        "negotiation_tip": summary_result.get("negotiation_tip"),
+                        "negotiation_tip": summary_result.negotiation_tip,
                         "confidence": risk_assessment.confidence,
-                        "processing_method": summary_result.get("processing_method", "gemini"),
+                        "processing_method": summary_result.processing_method,
                         "risk_factors": risk_assessment.risk_factors,
                         "metadata": {
                             "risk_score": risk_assessment.risk_score,
@@ -290,7 +291,7 @@ class DocumentOrchestrator:
                 # Stage 8: Generate Document-Level Analytics
                 logger.info("Stage 8: Document-level analytics")
                 
-                document_risk_profile = await self.risk_analyzer.analyze_document_risk_profile(risk_assessments)
+                document_risk_profile = self.risk_analyzer.analyze_document_risk_profile(risk_assessments)
                 document_readability_analysis = await self.readability_service.analyze_document_readability(readability_comparisons)
                 
                 # Stage 9: Final Status Update
@@ -3,9 +3,13 @@ Gemini AI client for batch summarization and Q&A
 """
 import logging
 import json
+import re
+import time
 import asyncio
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
+from datetime import datetime, timezone
 
 from google import genai
 from google.genai import types
@@ -17,10 +21,115 @@ from app.models.document import SupportedLanguage
 
 logger = get_logger(__name__)
 
+# Allowed values for validated clause results, hoisted to module level for
+# O(1) membership checks without per-clause list allocation
+_VALID_RISK_LEVELS = frozenset({"low", "moderate", "attention"})
+_VALID_CATEGORIES = frozenset({
+    "Termination", "Liability", "Indemnity", "Confidentiality",
+    "Payment", "IP Ownership", "Dispute Resolution", "Governing Law",
+    "Assignment", "Modification", "Warranties", "Force Majeure", "Definitions", "Other"
+})
+
+# Legal jargon translations for clarity, applied when post-processing
+# Gemini output into advisor-style language
+_JARGON_TRANSLATIONS = {
+    "the contract": "your contract",
+    "the agreement": "your agreement", 
+    "you should": "it is recommended that you",
+    "may result in": "could lead to",
+    "pursuant to": "according to",
+    "in the event that": "if",
+    "notwithstanding": "despite",
+    "hereinafter": "from now on in this document",
+    "whereas": "since",
+    "therefor": "because of this",
+    "aforementioned": "mentioned earlier",
+    "subsequent": "later",
+    "prior": "earlier",
+    "terminate": "end",
+    "commence": "start",
+    "obligations": "responsibilities",
+    "liabilities": "potential costs or responsibilities",
+    "indemnify": "protect and cover costs for",
+    "liquidated damages": "penalty fees",
+    "force majeure": "uncontrollable events (like natural disasters)",
+    "intellectual property": "ideas, designs, and creative work",
+    "proprietary": "owned exclusively by",
+    "confidential": "private and secret",
+    "jurisdiction": "which court system handles disputes"
+}
+
+# Professional clarifications - remove overly casual tone
+_PROFESSIONAL_CLARIFICATIONS = {
+    "this means": "This means:",
+    "important": "important",
+    "risk": "potential risk",
+    "attention": "requires attention",
+    "unlimited": "unlimited",
+    "automatically": "automatically",
+    "perpetual": "perpetual",
+    "irrevocable": "cannot be changed later",
+    "waive": "give up your right to",
+    "hold harmless": "protect them from any costs",
+    "sole discretion": "their complete discretion",
+    "reasonable": "reasonable"
+}
+
+# Single alternation over all terms, longest-first so overlapping terms
+# resolve to the most specific match in one scan
+_ADVISOR_REPLACEMENTS = MappingProxyType(
+    {**_JARGON_TRANSLATIONS, **_PROFESSIONAL_CLARIFICATIONS}
+)
+_ADVISOR_PATTERN = re.compile(
+    "|".join(
+        re.escape(term)
+        for term in sorted(_ADVISOR_REPLACEMENTS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _advisor_replacement(match: "re.Match[str]") -> str:
+    """Resolve a matched advisor term to its plain-language replacement.
+
+    The matched term's initial capitalization carries over, so
+    sentence-initial words keep their casing after replacement.
+    """
+    matched = match.group(0)
+    replacement = _ADVISOR_REPLACEMENTS.get(matched.lower())
+    if replacement is None:
+        return matched
+    if matched[0].isupper() and replacement and replacement[0].islower():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
+
 class GeminiError(Exception):
     """Custom exception for Gemini API errors."""
     pass
 
+@dataclass(slots=True)
+class ClauseResult:
+    """Validated summarization result for a single clause.
+
+    Slotted so large documents hold thousands of results without
+    per-instance dict overhead.
+    """
+    clause_id: str
+    original_text: str
+    summary: str
+    category: str
+    risk_level: str
+    negotiation_tip: Optional[str]
+    confidence: float
+    processing_method: str
+    processed_at: str
+    needs_review: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization/storage."""
+        return asdict(self)
+
 class TokenEstimator:
     """Utility class for estimating token counts."""
     
@@ -50,73 +159,145 @@ class GeminiClient:
         self.settings = get_settings()
         self._client: Optional[genai.Client] = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize Google GenAI client."""
         if self._initialized:
             return
         
-        try:
-            # Initialize Google GenAI client for Vertex AI
-            self._client = genai.Client(
-                vertexai=True,
-                project=self.settings.PROJECT_ID,
-                location=self.settings.VERTEX_AI_LOCATION
-            )
-            
-            self._initialized = True
-            logger.info(f"Google GenAI client initialized for model: {self.settings.GEMINI_MODEL_NAME}")
+        # Guard against concurrent initialization: without the lock, two
+        # coroutines can both see _initialized False and build duplicate
+        # genai.Client instances (and connection pools)
+        async with self._init_lock:
+            if self._initialized:
+                return
             
-        except Exception as e:
-            logger.error(f"Failed to initialize Google GenAI client: {e}")
-            raise GeminiError(f"GenAI client initialization failed: {e}")
+            try:
+                # Initialize Google GenAI client for Vertex AI
+                self._client = genai.Client(
+                    vertexai=True,
+                    project=self.settings.PROJECT_ID,
+                    location=self.settings.VERTEX_AI_LOCATION
+                )
+                
+                self._initialized = True
+                logger.info(f"Google GenAI client initialized for model: {self.settings.GEMINI_MODEL_NAME}")
+                
+            except Exception as e:
+                logger.error(f"Failed to initialize Google GenAI client: {e}")
+                raise GeminiError(f"GenAI client initialization failed: {e}")
 
     async def batch_summarize_clauses(
         self,
         clauses: List[ClauseCandidate],
         include_negotiation_tips: bool = True,
         language: SupportedLanguage = SupportedLanguage.ENGLISH
-    ) -> List[Dict[str, Any]]:
-        """Batch summarize clauses using Gemini with structured JSON output and parallel processing."""
+    ) -> AsyncIterator[ClauseResult]:
+        """Summarize clauses using Gemini, yielding results as each batch completes.
+
+        Streaming keeps the first results available after roughly one batch
+        latency instead of waiting on the slowest batch, and avoids holding
+        the full result list in memory.
+        """
         await self.initialize()
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         
         with LogContext(logger, clause_count=len(clauses)):
             logger.info("Starting batch clause summarization")
-            batches = self._create_batches(clauses, self.settings.MAX_CLAUSES_PER_BATCH)
+
+            # Short-circuit trivially small clauses: a deterministic result is
+            # emitted without spending an LLM round-trip on them. Results are
+            # keyed by document-level clause position so callers can restore
+            # the original clause order after out-of-order batch completion.
+            min_chars = self.settings.MIN_CLAUSE_CHARS
+            llm_entries = []
+            trivial_results = []
+            processed_at = datetime.now(timezone.utc).isoformat()
+            for i, clause in enumerate(clauses):
+                if len(clause.text.strip()) < min_chars:
+                    trivial_results.append(self._create_trivial_result(clause, i, processed_at))
+                else:
+                    llm_entries.append((i, clause))
+
+            if trivial_results:
+                logger.info(f"Skipping Gemini for {len(trivial_results)} trivially short clauses")
+                for result in trivial_results:
+                    yield result
+
+            batches = self._create_batches(
+                [clause for _, clause in llm_entries], self.settings.MAX_CLAUSES_PER_BATCH
+            )
             
-            # Create tasks for all batches to process them in parallel
+            # Create tasks for all batches to process them in parallel.
+            # Batches are contiguous slices of llm_entries, so the original
+            # clause positions for each batch can be recovered by offset.
             batch_tasks = []
+            offset = 0
             for i, batch in enumerate(batches):
                 logger.info(f"Queuing batch {i+1}/{len(batches)} with {len(batch)} clauses")
+                clause_positions = [index for index, _ in llm_entries[offset:offset + len(batch)]]
+                offset += len(batch)
                 task = asyncio.create_task(
-                    self._process_batch_with_retry(batch, include_negotiation_tips, i+1)
+                    self._run_batch(batch, clause_positions, include_negotiation_tips, i+1)
                 )
                 batch_tasks.append(task)
             
             logger.info(f"Processing {len(batch_tasks)} batches concurrently...")
-            all_results = []
+            result_count = len(trivial_results)
             
-            # Process batches as they complete
+            # Yield batch results as they complete
             for task in asyncio.as_completed(batch_tasks):
                 try:
                     batch_results = await task
-                    all_results.extend(batch_results)
                 except Exception as e:
                     logger.error(f"Batch task failed: {e}")
                     # Task should have already handled fallback, but add safety check
                     continue
+                for result in batch_results:
+                    result_count += 1
+                    yield result
             
-            processing_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            processing_time = (time.monotonic() - start_time) * 1000
             log_execution_time(logger, "batch_summarization", processing_time)
-            logger.info(f"Batch summarization complete: {len(all_results)} results")
-            return all_results
+            logger.info(f"Batch summarization complete: {result_count} results")
+    
+    async def batch_summarize_clauses_list(
+        self,
+        clauses: List[ClauseCandidate],
+        include_negotiation_tips: bool = True,
+        language: SupportedLanguage = SupportedLanguage.ENGLISH
+    ) -> List[ClauseResult]:
+        """Materialize batch_summarize_clauses, restoring original clause order."""
+        results = [
+            result
+            async for result in self.batch_summarize_clauses(
+                clauses, include_negotiation_tips, language
+            )
+        ]
+        # Results arrive in batch-completion order; clause_id carries the
+        # document-level position, so sort to realign with the input clauses
+        results.sort(key=lambda result: int(result.clause_id.rsplit("_", 1)[1]))
+        return results
+    
+    async def _run_batch(
+        self, 
+        batch: List[ClauseCandidate], 
+        clause_positions: List[int],
+        include_negotiation_tips: bool,
+        batch_num: int
+    ) -> List[ClauseResult]:
+        """Process one batch and re-key its results to document-level positions."""
+        results = await self._process_batch_with_retry(batch, include_negotiation_tips, batch_num)
+        for position, result in zip(clause_positions, results):
+            result.clause_id = f"clause_{position}"
+        return results
     
     async def _process_batch(
         self, 
         clauses: List[ClauseCandidate], 
         include_negotiation_tips: bool
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ClauseResult]:
         """Process a single batch of clauses."""
         
         system_prompt = self._build_system_prompt(include_negotiation_tips)
@@ -149,7 +330,7 @@ class GeminiClient:
         batch: List[ClauseCandidate], 
         include_negotiation_tips: bool,
         batch_num: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ClauseResult]:
         """Process a batch with error handling and fallback results."""
         try:
             logger.info(f"Processing batch {batch_num} with {len(batch)} clauses")
@@ -256,11 +437,13 @@ class GeminiClient:
     
     def _build_batch_prompt(self, clauses: List[ClauseCandidate]) -> str:
         """Build the user prompt for a batch of clauses."""
-        clauses_text = "CLAUSES:\n"
+        # Accumulate parts and join once to avoid O(N) string reallocations
+        clause_parts = ["CLAUSES:\n"]
         for i, clause in enumerate(clauses):
-            clauses_text += f"===\n"
-            clauses_text += f'{{"id": "clause_{i}", "text": "{self._escape_json_string(clause.text[:2000])}"}} \n'
-            clauses_text += "===\n"
+            clause_parts.append("===\n")
+            clause_parts.append(f'{{"id": "clause_{i}", "text": "{self._escape_json_string(clause.text[:2000])}"}} \n')
+            clause_parts.append("===\n")
+        clauses_text = "".join(clause_parts)
         output_format = {
             "id": "clause_0",
             "summary": "Clear explanation of what this clause means in everyday language, focusing on practical implications",
@@ -326,7 +509,7 @@ class GeminiClient:
         self, 
         response: str, 
         original_clauses: List[ClauseCandidate]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ClauseResult]:
         """Parse and validate the batch response JSON."""
         
         try:
@@ -343,17 +526,19 @@ class GeminiClient:
             if not isinstance(parsed_results, list):
                 raise ValueError("Response is not a JSON array")
             
-            # Validate and enrich results
+            # Validate and enrich results, stamping the whole batch once
+            # instead of re-reading the clock per clause
+            processed_at = datetime.now(timezone.utc).isoformat()
             validated_results = []
             for i, result in enumerate(parsed_results):
                 if i < len(original_clauses):
-                    validated_result = self._validate_result(result, original_clauses[i], i)
+                    validated_result = self._validate_result(result, original_clauses[i], i, processed_at)
                     validated_results.append(validated_result)
             
             # Fill in missing results with fallbacks
             while len(validated_results) < len(original_clauses):
                 i = len(validated_results)
-                fallback_result = self._create_fallback_result(original_clauses[i], i)
+                fallback_result = self._create_fallback_result(original_clauses[i], i, processed_at)
                 validated_results.append(fallback_result)
             
             return validated_results
@@ -369,57 +554,90 @@ class GeminiClient:
         self, 
         result: Dict[str, Any], 
         original_clause: ClauseCandidate, 
-        index: int
-    ) -> Dict[str, Any]:
+        index: int,
+        processed_at: str
+    ) -> ClauseResult:
         """Validate and enrich a single result."""
         
-        # Required fields with defaults
-        validated = {
-            "clause_id": f"clause_{index}",
-            "original_text": original_clause.text,
-            "summary": self._enhance_advisor_language(result.get("summary", "Summary not available")),
-            "category": result.get("clause_category", "Other"),
-            "risk_level": result.get("risk_level", "moderate"),
-            "negotiation_tip": self._enhance_advisor_language(result.get("negotiation_tip", "")) if result.get("negotiation_tip") else None,
-            "confidence": 0.8,  # Default confidence for Gemini results
-            "processing_method": "gemini",
-            "processed_at": datetime.utcnow().isoformat()
-        }
-        
         # Validate risk level
-        valid_risk_levels = ["low", "moderate", "attention"]
-        if validated["risk_level"] not in valid_risk_levels:
-            validated["risk_level"] = "moderate"
-        
+        risk_level = result.get("risk_level", "moderate")
+        if risk_level not in _VALID_RISK_LEVELS:
+            risk_level = "moderate"
+
         # Validate category
-        valid_categories = [
-            "Termination", "Liability", "Indemnity", "Confidentiality",
-            "Payment", "IP Ownership", "Dispute Resolution", "Governing Law",
-            "Assignment", "Modification", "Warranties", "Force Majeure", "Definitions", "Other"
-        ]
-        if validated["category"] not in valid_categories:
-            validated["category"] = "Other"
-        
-        return validated
+        category = result.get("clause_category", "Other")
+        if category not in _VALID_CATEGORIES:
+            category = "Other"
+
+        summary = result.get("summary", "Summary not available")
+        negotiation_tip = result.get("negotiation_tip")
+
+        if negotiation_tip:
+            # Fuse both enhancement passes into one scan by joining the texts
+            # on a sentinel, translating once, then splitting them back apart
+            translated = self._translate_advisor_terms(f"{summary}\x1e{negotiation_tip}")
+            summary, _, negotiation_tip = translated.partition("\x1e")
+            summary = self._apply_recommendation_prefix(summary)
+            negotiation_tip = self._apply_recommendation_prefix(negotiation_tip)
+        else:
+            summary = self._enhance_advisor_language(summary)
+            negotiation_tip = None
+
+        return ClauseResult(
+            clause_id=f"clause_{index}",
+            original_text=original_clause.text,
+            summary=summary,
+            category=category,
+            risk_level=risk_level,
+            negotiation_tip=negotiation_tip,
+            confidence=0.8,  # Default confidence for Gemini results
+            processing_method="gemini",
+            processed_at=processed_at
+        )
     
-    def _create_fallback_results(self, clauses: List[ClauseCandidate]) -> List[Dict[str, Any]]:
+    def _create_trivial_result(
+        self, 
+        clause: ClauseCandidate, 
+        index: int, 
+        processed_at: str
+    ) -> ClauseResult:
+        """Create a deterministic result for a clause too short to summarize."""
+        return ClauseResult(
+            clause_id=f"clause_{index}",
+            original_text=clause.text,
+            summary=clause.text.strip() or "This clause is empty.",
+            category=getattr(clause, 'category', 'Other'),
+            risk_level="low",
+            negotiation_tip=None,
+            confidence=0.5,
+            processing_method="skipped-trivial",
+            processed_at=processed_at
+        )
+    
+    def _create_fallback_results(self, clauses: List[ClauseCandidate]) -> List[ClauseResult]:
         """Create fallback results for failed batch processing."""
-        return [self._create_fallback_result(clause, i) for i, clause in enumerate(clauses)]
+        processed_at = datetime.now(timezone.utc).isoformat()
+        return [self._create_fallback_result(clause, i, processed_at) for i, clause in enumerate(clauses)]
     
-    def _create_fallback_result(self, clause: ClauseCandidate, index: int) -> Dict[str, Any]:
+    def _create_fallback_result(
+        self, 
+        clause: ClauseCandidate, 
+        index: int, 
+        processed_at: Optional[str] = None
+    ) -> ClauseResult:
         """Create a fallback result for a single clause."""
-        return {
-            "clause_id": f"clause_{index}",
-            "original_text": clause.text,
-            "summary": "This clause requires manual review. Automatic summarization failed.",
-            "category": getattr(clause, 'category', 'Other'),
-            "risk_level": "moderate",
-            "negotiation_tip": None,
-            "confidence": 0.3,
-            "processing_method": "fallback",
-            "processed_at": datetime.utcnow().isoformat(),
-            "needs_review": True
-        }
+        return ClauseResult(
+            clause_id=f"clause_{index}",
+            original_text=clause.text,
+            summary="This clause requires manual review. Automatic summarization failed.",
+            category=getattr(clause, 'category', 'Other'),
+            risk_level="moderate",
+            negotiation_tip=None,
+            confidence=0.3,
+            processing_method="fallback",
+            processed_at=processed_at or datetime.now(timezone.utc).isoformat(),
+            needs_review=True
+        )
     
     def _create_batches(
         self, 
@@ -585,33 +803,35 @@ Always output in strict JSON format only."""
                 docs_clauses[doc_id] = []
             docs_clauses[doc_id].append(clause)
         
-        # Build clauses text with document separation
-        clauses_text = ""
+        # Build clauses text with document separation, joining once at the end
+        # to avoid quadratic string concatenation on large clause sets
+        clause_parts = []
         if len(docs_clauses) > 1:
-            clauses_text += "IMPORTANT: The following clauses come from MULTIPLE DOCUMENTS. You should consider information from ALL documents when answering.\n\n"
-            
+            clause_parts.append("IMPORTANT: The following clauses come from MULTIPLE DOCUMENTS. You should consider information from ALL documents when answering.\n\n")
+
             for doc_id, doc_clauses in docs_clauses.items():
                 # Get document name if available
                 doc_name = doc_clauses[0].get('doc_name', doc_id) if doc_clauses else doc_id
-                clauses_text += f"=== DOCUMENT: {doc_name} ===\n"
-                
+                clause_parts.append(f"=== DOCUMENT: {doc_name} ===\n")
+
                 for clause in doc_clauses:
                     clause_order = clause.get('order', 1)
                     clause_category = clause.get('category', 'Unknown')
-                    clauses_text += f"Clause {clause_order} ({clause_category}):\n"
-                    clauses_text += f"Summary: {clause.get('summary', '')}\n"
-                    clauses_text += f"Original: {clause.get('original_text', '')[:500]}...\n\n"
-                
-                clauses_text += "\n"
+                    clause_parts.append(f"Clause {clause_order} ({clause_category}):\n")
+                    clause_parts.append(f"Summary: {clause.get('summary', '')}\n")
+                    clause_parts.append(f"Original: {clause.get('original_text', '')[:500]}...\n\n")
+
+                clause_parts.append("\n")
         else:
             # Single document - use original format
-            clauses_text = "CLAUSES:\n"
+            clause_parts.append("CLAUSES:\n")
             for i, clause in enumerate(relevant_clauses):
                 clause_order = clause.get('order', i + 1)
                 clause_category = clause.get('category', 'Unknown')
-                clauses_text += f"Clause {clause_order} ({clause_category}):\n"
-                clauses_text += f"Summary: {clause.get('summary', '')}\n"
-                clauses_text += f"Original: {clause.get('original_text', '')[:500]}...\n\n"
+                clause_parts.append(f"Clause {clause_order} ({clause_category}):\n")
+                clause_parts.append(f"Summary: {clause.get('summary', '')}\n")
+                clause_parts.append(f"Original: {clause.get('original_text', '')[:500]}...\n\n")
+        clauses_text = "".join(clause_parts)
 
         # Language-specific response format examples
         language_examples = {
@@ -701,34 +921,42 @@ RESPONSE GUIDELINES:
             used_clause_ids = result.get("used_clause_ids", [])
             
             sources = []
-            
+
+            # Index relevant clauses once so citation lookups are O(1)
+            # instead of re-scanning the clause list per citation.
+            # First occurrence wins, matching the old linear scan: in the
+            # multi-document path clauses from different documents share
+            # order numbers, and a last-wins dict would miscite them
+            clauses_by_order: Dict[int, Dict[str, Any]] = {}
+            clauses_by_id: Dict[Optional[str], Dict[str, Any]] = {}
+            for clause in relevant_clauses:
+                clauses_by_order.setdefault(clause.get("order", 0), clause)
+                clauses_by_id.setdefault(clause.get("clause_id"), clause)
+
             # If we have clause numbers, match them to the relevant clauses
             if used_clause_numbers:
                 for clause_num in used_clause_numbers:
-                    for clause in relevant_clauses:
-                        clause_order = clause.get("order", 0)
-                        if clause_order == clause_num:
-                            sources.append({
-                                "clause_id": clause.get("clause_id", f"clause_{clause_num}"),
-                                "clause_number": clause_num,
-                                "category": clause.get("category", "Unknown"),
-                                "snippet": clause.get("summary", "")[:200] + "...",
-                                "relevance_score": 0.8
-                            })
-                            break
+                    clause = clauses_by_order.get(clause_num)
+                    if clause is not None:
+                        sources.append({
+                            "clause_id": clause.get("clause_id", f"clause_{clause_num}"),
+                            "clause_number": clause_num,
+                            "category": clause.get("category", "Unknown"),
+                            "snippet": clause.get("summary", "")[:200] + "...",
+                            "relevance_score": 0.8
+                        })
             else:
                 # Fallback to clause IDs for backward compatibility
                 for clause_id in used_clause_ids:
-                    for clause in relevant_clauses:
-                        if clause.get("clause_id") == clause_id:
-                            sources.append({
-                                "clause_id": clause_id,
-                                "clause_number": clause.get("order", 0),
-                                "category": clause.get("category", "Unknown"),
-                                "snippet": clause.get("summary", "")[:200] + "...",
-                                "relevance_score": 0.8
-                            })
-                            break
+                    clause = clauses_by_id.get(clause_id)
+                    if clause is not None:
+                        sources.append({
+                            "clause_id": clause_id,
+                            "clause_number": clause.get("order", 0),
+                            "category": clause.get("category", "Unknown"),
+                            "snippet": clause.get("summary", "")[:200] + "...",
+                            "relevance_score": 0.8
+                        })
             
             # Enhance response with advisor language
             result["answer"] = self._enhance_advisor_language(result.get("answer", ""))
@@ -739,7 +967,7 @@ RESPONSE GUIDELINES:
             result["used_clause_ids"] = [source["clause_id"] for source in sources]
             result["used_clause_numbers"] = [source["clause_number"] for source in sources]
             result["sources"] = sources
-            result["timestamp"] = datetime.utcnow().isoformat()
+            result["timestamp"] = datetime.now(timezone.utc).isoformat()
             
             return result
             
@@ -761,64 +989,35 @@ RESPONSE GUIDELINES:
         """Post-process text to improve clarity and professional tone."""
         if not text:
             return text
-            
-        # Legal jargon translations for clarity
-        jargon_translations = {
-            "the contract": "your contract",
-            "the agreement": "your agreement", 
-            "you should": "it is recommended that you",
-            "may result in": "could lead to",
-            "pursuant to": "according to",
-            "in the event that": "if",
-            "notwithstanding": "despite",
-            "hereinafter": "from now on in this document",
-            "whereas": "since",
-            "therefor": "because of this",
-            "aforementioned": "mentioned earlier",
-            "subsequent": "later",
-            "prior": "earlier",
-            "terminate": "end",
-            "commence": "start",
-            "obligations": "responsibilities",
-            "liabilities": "potential costs or responsibilities",
-            "indemnify": "protect and cover costs for",
-            "liquidated damages": "penalty fees",
-            "force majeure": "uncontrollable events (like natural disasters)",
-            "intellectual property": "ideas, designs, and creative work",
-            "proprietary": "owned exclusively by",
-            "confidential": "private and secret",
-            "jurisdiction": "which court system handles disputes"
-        }
-        
-        # Professional clarifications - remove overly casual tone
-        professional_clarifications = {
-            "this means": "This means:",
-            "important": "important",
-            "risk": "potential risk",
-            "attention": "requires attention",
-            "unlimited": "unlimited",
-            "automatically": "automatically",
-            "perpetual": "perpetual",
-            "irrevocable": "cannot be changed later",
-            "waive": "give up your right to",
-            "hold harmless": "protect them from any costs",
-            "sole discretion": "their complete discretion",
-            "reasonable": "reasonable"
-        }
-        
-        enhanced_text = text
-        
-        # Apply jargon translations for clarity
-        for legal_term, plain_language in jargon_translations.items():
-            enhanced_text = enhanced_text.replace(legal_term, plain_language)
-        
-        # Apply professional clarifications
-        for term, clarified_term in professional_clarifications.items():
-            enhanced_text = enhanced_text.replace(term, clarified_term)
-        
-        # Add professional guidance prefix for negotiation tips
-        if "negotiate" in enhanced_text.lower() or "ask for" in enhanced_text.lower():
-            if not enhanced_text.startswith("Recommendation:"):
-                enhanced_text = f"Recommendation: {enhanced_text}"
-        
-        return enhanced_text
\ No newline at end of file
+        return self._apply_recommendation_prefix(self._translate_advisor_terms(text))
+
+    def _translate_advisor_terms(self, text: str) -> str:
+        """Apply jargon translations and professional clarifications to text."""
+        # One pass through the compiled alternation replaces every known
+        # term, instead of one full string scan per mapping entry
+        return _ADVISOR_PATTERN.sub(_advisor_replacement, text)
+
+    def _apply_recommendation_prefix(self, text: str) -> str:
+        """Add professional guidance prefix for negotiation-style advice."""
+        text_lower = text.lower()
+        if "negotiate" in text_lower or "ask for" in text_lower:
+            if not text.startswith("Recommendation:"):
+                return f"Recommendation: {text}"
+        return text
+
+
+# Process-wide shared client instance so every caller reuses one
+# connection pool instead of constructing private GeminiClient copies
+_shared_gemini_client: Optional[GeminiClient] = None
+
+
+def get_shared_gemini_client() -> GeminiClient:
+    """Get the process-wide GeminiClient instance.
+
+    The instance is initialized lazily (and race-safely) on first use via
+    GeminiClient.initialize().
+    """
+    global _shared_gemini_client
+    if _shared_gemini_client is None:
+        _shared_gemini_client = GeminiClient()
+    return _shared_gemini_client
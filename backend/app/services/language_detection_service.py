@@ -258,10 +258,10 @@ class LanguageDetectionService:
         context: Optional[str] = None
     ) -> LanguageDetectionResult:
         """Use Gemini for context-aware language detection"""
-        from app.services.gemini_client import GeminiClient, GeminiError
+        from app.services.gemini_client import GeminiError, get_shared_gemini_client
 
         try:
-            gemini_client = GeminiClient()
+            gemini_client = get_shared_gemini_client()
             await gemini_client.initialize()
 
             # Build detection prompt
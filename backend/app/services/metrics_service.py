@@ -5,10 +5,17 @@ Provides methods to fetch summary metrics, trends, and detailed breakdowns
 from the BigQuery events table for the analytics dashboard.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import google.auth
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.cloud.bigquery import QueryJob
 
@@ -39,70 +46,251 @@ class MetricsService:
         """Initialize BigQuery client and table references."""
         settings = get_settings()
         
-        self.client = bigquery.Client(project=settings.PROJECT_ID)
+        # Size the HTTP connection pool explicitly: the default session
+        # keeps too few connections for the parallel dashboard queries,
+        # forcing fresh TCP/TLS setup under concurrent load
+        credentials, _ = google.auth.default()
+        session = AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        session.mount("https://", adapter)
+        
+        self.client = bigquery.Client(project=settings.PROJECT_ID, _http=session)
         self.dataset_id = settings.BIGQUERY_DATASET
         self.table_id = settings.BIGQUERY_TABLE
         self.table_path = f"{settings.PROJECT_ID}.{self.dataset_id}.{self.table_id}"
         
-        logger.info(f"MetricsService initialized with table: {self.table_path}")
-    
-    async def get_summary_metrics(
-        self,
-        hours: int = 24
-    ) -> MetricsSummary:
-        """
-        Get summary metrics for the specified time period.
-        
-        Args:
-            hours: Number of hours to look back (default: 24)
-            
-        Returns:
-            MetricsSummary with aggregated counts and averages
+        # Short-lived result cache: dashboards poll the same windows far more
+        # often than the underlying data changes, so 60s staleness is fine
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[Tuple, asyncio.Lock] = {}
+        self._cache_ttl = 60.0
+        
+        # The BigQuery client blocks; queries run on this bounded pool so
+        # the event loop stays free and independent queries can overlap
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="metrics-bq")
+        
+        # Pre-built query texts: interpolating the table path once keeps the
+        # statements byte-stable across calls, which is what lets BigQuery's
+        # result cache match repeated dashboard queries
+        self._sql_combined = f"""
+        WITH base AS (
+            SELECT
+                event_type,
+                JSON_VALUE(event_data, '$.risk_level') AS risk_level,
+                JSON_VALUE(event_data, '$.category') AS category,
+                CAST(JSON_VALUE(event_data, '$.risk_score') AS FLOAT64) AS risk_score,
+                CAST(JSON_VALUE(event_data, '$.processing_time_ms') AS INT64) AS processing_time_ms,
+                CAST(JSON_VALUE(event_data, '$.response_time_ms') AS INT64) AS response_time_ms,
+                CAST(JSON_VALUE(event_data, '$.answer_confidence') AS FLOAT64) AS answer_confidence
+            FROM `{self.table_path}`
+            WHERE timestamp >= TIMESTAMP(@period_start)
+              AND timestamp < TIMESTAMP(@period_end)
+        ),
+        summary AS (
+            SELECT
+                COUNTIF(event_type = 'document_uploaded') as total_documents,
+                COUNTIF(event_type = 'clause_analyzed') as total_clauses,
+                COUNTIF(event_type = 'question_asked') as total_questions,
+                COUNTIF(event_type = 'risk_detected') as total_risks,
+                AVG(IF(event_type = 'document_uploaded', processing_time_ms, NULL)) as avg_processing_time_ms,
+                AVG(IF(event_type = 'question_asked', response_time_ms, NULL)) as avg_response_time_ms,
+                AVG(IF(event_type = 'question_asked', answer_confidence, NULL)) as avg_confidence,
+                SAFE_DIVIDE(
+                    COUNTIF(event_type = 'risk_detected'),
+                    COUNTIF(event_type = 'clause_analyzed')
+                ) * 100 as high_risk_percentage
+            FROM base
+        ),
+        breakdown AS (
+            SELECT
+                risk_level,
+                category,
+                COUNT(*) as count,
+                SUM(risk_score) as sum_risk_score,
+                COUNT(risk_score) as n_risk_score,
+                COUNTIF(risk_score >= 0.7) as high_risk_count
+            FROM base
+            WHERE event_type = 'clause_analyzed'
+            GROUP BY risk_level, category
+        )
+        SELECT
+            (SELECT AS STRUCT * FROM summary) as summary,
+            ARRAY(SELECT AS STRUCT * FROM breakdown) as breakdown
         """
-        period_start = datetime.utcnow() - timedelta(hours=hours)
-        period_end = datetime.utcnow()
-        
-        query = f"""
+
+        self._sql_trends_events = {
+            granularity: f"""
         SELECT
-            COUNTIF(event_type = 'document_uploaded') as total_documents,
-            COUNTIF(event_type = 'clause_analyzed') as total_clauses,
-            COUNTIF(event_type = 'question_asked') as total_questions,
-            COUNTIF(event_type = 'risk_detected') as total_risks,
-            
-            AVG(IF(event_type = 'document_uploaded', 
-                CAST(JSON_VALUE(event_data, '$.processing_time_ms') AS INT64), 
-                NULL)) as avg_processing_time_ms,
-            
-            AVG(IF(event_type = 'question_asked', 
-                CAST(JSON_VALUE(event_data, '$.response_time_ms') AS INT64), 
-                NULL)) as avg_response_time_ms,
-            
-            AVG(IF(event_type = 'question_asked', 
-                CAST(JSON_VALUE(event_data, '$.answer_confidence') AS FLOAT64), 
-                NULL)) as avg_confidence,
-            
-            SAFE_DIVIDE(
-                COUNTIF(event_type = 'risk_detected'),
-                COUNTIF(event_type = 'clause_analyzed')
-            ) * 100 as high_risk_percentage
-            
+            event_type,
+            {time_bucket} as time_bucket,
+            COUNT(*) as event_count
         FROM `{self.table_path}`
         WHERE timestamp >= TIMESTAMP(@period_start)
           AND timestamp < TIMESTAMP(@period_end)
+        GROUP BY event_type, time_bucket
         """
+            for granularity, time_bucket in {
+                "hourly": "TIMESTAMP_TRUNC(timestamp, HOUR)",
+                "daily": "TIMESTAMP_TRUNC(timestamp, DAY)",
+            }.items()
+        }
         
-        job_config = bigquery.QueryJobConfig(
+        logger.info(f"MetricsService initialized with table: {self.table_path}")
+    
+    def _job_config(
+        self,
+        endpoint: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> bigquery.QueryJobConfig:
+        """Build a job config with explicit result caching and cost labels."""
+        return bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("period_start", "TIMESTAMP", period_start),
                 bigquery.ScalarQueryParameter("period_end", "TIMESTAMP", period_end),
-            ]
+            ],
+            use_query_cache=True,
+            labels={"service": "metrics", "endpoint": endpoint},
         )
+    
+    @staticmethod
+    def _metrics_period(hours: int) -> Tuple[datetime, datetime]:
+        """
+        Compute the [start, end) window for an hours lookback, once per call.
+        
+        The end is rounded down to the hour: repeated calls produce
+        byte-identical query parameters (a consistent window across the
+        queries of one request and a BigQuery result-cache hit across
+        requests), and hour-aligned predicates are derivable from the
+        hourly buckets of events_hourly_agg, so BigQuery's automatic
+        materialized-view rewrite can serve these scans. Dashboards look
+        back hours to days, so up-to-an-hour of window lag is acceptable.
+        """
+        period_end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        return period_end - timedelta(hours=hours), period_end
+    
+    async def _run_blocking(self, fn: Callable[[], Any]) -> Any:
+        """Run a blocking BigQuery call on the service's thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+    
+    async def _cached(
+        self,
+        key: Tuple,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for key, computing it via fetch() on a miss.
         
-        query_job = self.client.query(query, job_config=job_config)
-        results = list(query_job.result())
+        A per-key lock ensures concurrent dashboard polls share one BigQuery
+        round-trip instead of stampeding on an expired entry.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+            
+            value = await fetch()
+            self._cache[key] = (time.monotonic(), value)
+            self._prune_expired()
+            return value
+    
+    def _prune_expired(self) -> None:
+        """
+        Drop expired cache entries and their locks.
         
-        if not results:
-            # Return empty metrics if no data
+        Time-rounded keys (e.g. the combined-query window) change every
+        minute, so without pruning the cache would grow for the lifetime
+        of the process.
+        """
+        now = time.monotonic()
+        expired = [k for k, (ts, _) in self._cache.items() if now - ts >= self._cache_ttl]
+        for key in expired:
+            del self._cache[key]
+            self._cache_locks.pop(key, None)
+    
+    async def _run_combined_metrics(
+        self,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Optional[bigquery.Row]:
+        """
+        Run summary, risk, and category aggregations as a single BigQuery job.
+
+        A shared base CTE projects the JSON fields once, and the final SELECT
+        packs the summary scalars plus risk/category breakdown arrays into one
+        row, so the events table is planned and scanned in one job instead of
+        three.
+        """
+        job_config = self._job_config("combined", period_start, period_end)
+
+        results = await self._cached(
+            ("combined", period_start, period_end),
+            lambda: self._run_blocking(
+                lambda: list(self.client.query_and_wait(self._sql_combined, job_config=job_config))
+            ),
+        )
+
+        return results[0] if results else None
+
+    @staticmethod
+    def _slice_risk_counts(breakdown: List[Dict]) -> Dict[str, int]:
+        """Aggregate the (risk_level, category) breakdown into risk-level counts."""
+        risk_counts = {"low": 0, "moderate": 0, "attention": 0}
+        for row in breakdown:
+            if row["risk_level"] in risk_counts:
+                risk_counts[row["risk_level"]] += row["count"]
+        return risk_counts
+
+    @staticmethod
+    def _slice_category_distribution(breakdown: List[Dict]) -> Dict[str, int]:
+        """Aggregate the breakdown into per-category counts."""
+        category_distribution: Counter = Counter()
+        for row in breakdown:
+            if row["category"]:
+                category_distribution[row["category"]] += row["count"]
+        return dict(category_distribution)
+
+    @staticmethod
+    def _slice_top_categories(breakdown: List[Dict], limit: int = 10) -> List[CategoryBreakdown]:
+        """Aggregate the breakdown into the top categories by clause count."""
+        per_category: Dict = {}
+        for row in breakdown:
+            stats = per_category.setdefault(
+                row["category"],
+                {"count": 0, "sum_risk_score": 0.0, "n_risk_score": 0, "high_risk_count": 0},
+            )
+            stats["count"] += row["count"]
+            stats["sum_risk_score"] += row["sum_risk_score"] or 0.0
+            stats["n_risk_score"] += row["n_risk_score"]
+            stats["high_risk_count"] += row["high_risk_count"]
+
+        ranked = sorted(per_category.items(), key=lambda item: item[1]["count"], reverse=True)
+        return [
+            CategoryBreakdown.model_construct(
+                category=category or "Unknown",
+                count=stats["count"],
+                avg_risk_score=(
+                    stats["sum_risk_score"] / stats["n_risk_score"]
+                    if stats["n_risk_score"] else 0.0
+                ),
+                high_risk_count=stats["high_risk_count"]
+            )
+            for category, stats in ranked[:limit]
+        ]
+
+    def _build_summary(
+        self,
+        summary_struct: Optional[Dict],
+        period_start: datetime,
+        period_end: datetime
+    ) -> MetricsSummary:
+        """Build a MetricsSummary model from the combined query's summary struct."""
+        if not summary_struct:
             return MetricsSummary(
                 total_documents=0,
                 total_clauses=0,
@@ -115,21 +303,42 @@ class MetricsService:
                 period_start=period_start,
                 period_end=period_end
             )
-        
-        row = results[0]
-        
+
         return MetricsSummary(
-            total_documents=row.total_documents or 0,
-            total_clauses=row.total_clauses or 0,
-            total_questions=row.total_questions or 0,
-            total_risks=row.total_risks or 0,
-            avg_processing_time_ms=row.avg_processing_time_ms or 0.0,
-            avg_response_time_ms=row.avg_response_time_ms or 0.0,
-            avg_confidence=row.avg_confidence or 0.0,
-            high_risk_percentage=row.high_risk_percentage or 0.0,
+            total_documents=summary_struct["total_documents"] or 0,
+            total_clauses=summary_struct["total_clauses"] or 0,
+            total_questions=summary_struct["total_questions"] or 0,
+            total_risks=summary_struct["total_risks"] or 0,
+            avg_processing_time_ms=summary_struct["avg_processing_time_ms"] or 0.0,
+            avg_response_time_ms=summary_struct["avg_response_time_ms"] or 0.0,
+            avg_confidence=summary_struct["avg_confidence"] or 0.0,
+            high_risk_percentage=summary_struct["high_risk_percentage"] or 0.0,
             period_start=period_start,
             period_end=period_end
         )
+
+    async def get_summary_metrics(
+        self,
+        hours: int = 24
+    ) -> MetricsSummary:
+        """
+        Get summary metrics for the specified time period.
+        
+        Args:
+            hours: Number of hours to look back (default: 24)
+            
+        Returns:
+            MetricsSummary with aggregated counts and averages
+        """
+        return await self._cached(("summary", hours), lambda: self._fetch_summary_metrics(hours))
+    
+    async def _fetch_summary_metrics(self, hours: int) -> MetricsSummary:
+        """Compute summary metrics from BigQuery (uncached)."""
+        period_start, period_end = self._metrics_period(hours)
+        
+        row = await self._run_combined_metrics(period_start, period_end)
+        
+        return self._build_summary(row["summary"] if row else None, period_start, period_end)
     
     async def get_trends(
         self,
@@ -146,92 +355,66 @@ class MetricsService:
         Returns:
             MetricsTrends with time series data
         """
-        period_start = datetime.utcnow() - timedelta(hours=hours)
-        period_end = datetime.utcnow()
+        return await self._cached(
+            ("trends", hours, granularity), lambda: self._fetch_trends(hours, granularity)
+        )
+    
+    async def _fetch_trends(self, hours: int, granularity: str) -> MetricsTrends:
+        """Compute trend metrics from BigQuery (uncached)."""
+        period_start, period_end = self._metrics_period(hours)
         
         # Determine time bucket format
         if granularity == "hourly":
-            time_bucket = "TIMESTAMP_TRUNC(timestamp, HOUR)"
+            events_query = self._sql_trends_events["hourly"]
             format_string = "%Y-%m-%d %H:00"
         else:
-            time_bucket = "TIMESTAMP_TRUNC(timestamp, DAY)"
+            events_query = self._sql_trends_events["daily"]
             format_string = "%Y-%m-%d"
         
-        # Query for event trends
-        events_query = f"""
-        SELECT
-            event_type,
-            {time_bucket} as time_bucket,
-            COUNT(*) as event_count
-        FROM `{self.table_path}`
-        WHERE timestamp >= TIMESTAMP(@period_start)
-          AND timestamp < TIMESTAMP(@period_end)
-        GROUP BY event_type, time_bucket
-        ORDER BY event_type, time_bucket
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("period_start", "TIMESTAMP", period_start),
-                bigquery.ScalarQueryParameter("period_end", "TIMESTAMP", period_end),
-            ]
+        job_config = self._job_config("trends", period_start, period_end)
+        
+        # The risk/category distributions come from the same combined job
+        # that backs summary/details, so the clause_analyzed subset is
+        # scanned once rather than per endpoint. Both round-trips overlap.
+        # The events result is materialized through the Storage Read API
+        # (Arrow) instead of the row-by-row REST path.
+        events_df, combined_row = await asyncio.gather(
+            self._run_blocking(
+                lambda: self.client.query_and_wait(events_query, job_config=job_config)
+                .to_dataframe(create_bqstorage_client=True)
+            ),
+            self._run_combined_metrics(period_start, period_end),
         )
         
-        query_job = self.client.query(events_query, job_config=job_config)
-        events_results = list(query_job.result())
-        
-        # Group by event type
-        event_trends_dict: Dict[str, List[TrendDataPoint]] = {}
-        event_totals: Dict[str, int] = {}
-        
-        for row in events_results:
-            event_type = row.event_type
-            if event_type not in event_trends_dict:
-                event_trends_dict[event_type] = []
-                event_totals[event_type] = 0
-            
-            event_trends_dict[event_type].append(
-                TrendDataPoint(
-                    timestamp=row.time_bucket,
-                    value=float(row.event_count),
-                    label=row.time_bucket.strftime(format_string)
+        # Build per-event-type trends with vectorized pandas operations:
+        # labels are formatted column-wise and the per-row dict/append
+        # bookkeeping collapses into a groupby
+        event_trends = []
+        if not events_df.empty:
+            # Chronological ordering is applied here instead of an ORDER BY,
+            # sparing BigQuery a cross-worker sort on the grouped output
+            events_df = events_df.sort_values("time_bucket")
+            events_df["label"] = events_df["time_bucket"].dt.strftime(format_string)
+            events_df["value"] = events_df["event_count"].astype(float)
+            for event_type, group in events_df.groupby("event_type", sort=False):
+                event_trends.append(
+                    EventTypeTrend(
+                        event_type=event_type,
+                        data_points=[
+                            # model_construct skips validation; the rows come
+                            # straight from BigQuery with known types
+                            TrendDataPoint.model_construct(timestamp=t, value=v, label=l)
+                            for t, v, l in zip(
+                                group["time_bucket"], group["value"], group["label"]
+                            )
+                        ],
+                        total_count=int(group["event_count"].sum())
+                    )
                 )
-            )
-            event_totals[event_type] += row.event_count
         
-        event_trends = [
-            EventTypeTrend(
-                event_type=event_type,
-                data_points=data_points,
-                total_count=event_totals[event_type]
-            )
-            for event_type, data_points in event_trends_dict.items()
-        ]
-        
-        # Query for risk and category distributions
-        dist_query = f"""
-        SELECT
-            JSON_VALUE(event_data, '$.risk_level') as risk_level,
-            JSON_VALUE(event_data, '$.category') as category,
-            COUNT(*) as count
-        FROM `{self.table_path}`
-        WHERE timestamp >= TIMESTAMP(@period_start)
-          AND timestamp < TIMESTAMP(@period_end)
-          AND event_type = 'clause_analyzed'
-        GROUP BY risk_level, category
-        """
-        
-        dist_job = self.client.query(dist_query, job_config=job_config)
-        dist_results = list(dist_job.result())
-        
-        risk_distribution: Dict[str, int] = {"low": 0, "moderate": 0, "attention": 0}
-        category_distribution: Dict[str, int] = {}
-        
-        for row in dist_results:
-            if row.risk_level:
-                risk_distribution[row.risk_level] = risk_distribution.get(row.risk_level, 0) + row.count
-            if row.category:
-                category_distribution[row.category] = category_distribution.get(row.category, 0) + row.count
+        breakdown = list(combined_row["breakdown"]) if combined_row else []
+        risk_distribution = self._slice_risk_counts(breakdown)
+        category_distribution = self._slice_category_distribution(breakdown)
         
         return MetricsTrends(
             event_trends=event_trends,
@@ -258,38 +441,18 @@ class MetricsService:
         Returns:
             MetricsDetails with comprehensive analytics
         """
-        summary = await self.get_summary_metrics(hours)
-        
-        period_start = datetime.utcnow() - timedelta(hours=hours)
-        period_end = datetime.utcnow()
-        
-        # Risk distribution query
-        risk_query = f"""
-        SELECT
-            JSON_VALUE(event_data, '$.risk_level') as risk_level,
-            COUNT(*) as count
-        FROM `{self.table_path}`
-        WHERE timestamp >= TIMESTAMP(@period_start)
-          AND timestamp < TIMESTAMP(@period_end)
-          AND event_type = 'clause_analyzed'
-        GROUP BY risk_level
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("period_start", "TIMESTAMP", period_start),
-                bigquery.ScalarQueryParameter("period_end", "TIMESTAMP", period_end),
-            ]
-        )
+        return await self._cached(("details", hours), lambda: self._fetch_detailed_metrics(hours))
+    
+    async def _fetch_detailed_metrics(self, hours: int) -> MetricsDetails:
+        """Compute detailed metrics from BigQuery (uncached)."""
+        period_start, period_end = self._metrics_period(hours)
         
-        risk_job = self.client.query(risk_query, job_config=job_config)
-        risk_results = list(risk_job.result())
+        row = await self._run_combined_metrics(period_start, period_end)
         
-        risk_counts = {"low": 0, "moderate": 0, "attention": 0}
-        for row in risk_results:
-            if row.risk_level in risk_counts:
-                risk_counts[row.risk_level] = row.count
+        summary = self._build_summary(row["summary"] if row else None, period_start, period_end)
         
+        breakdown = list(row["breakdown"]) if row else []
+        risk_counts = self._slice_risk_counts(breakdown)
         total_clauses = sum(risk_counts.values())
         
         risk_distribution = RiskDistribution(
@@ -299,34 +462,7 @@ class MetricsService:
             total=total_clauses
         )
         
-        # Category breakdown query
-        category_query = f"""
-        SELECT
-            JSON_VALUE(event_data, '$.category') as category,
-            COUNT(*) as count,
-            AVG(CAST(JSON_VALUE(event_data, '$.risk_score') AS FLOAT64)) as avg_risk_score,
-            COUNTIF(CAST(JSON_VALUE(event_data, '$.risk_score') AS FLOAT64) >= 0.7) as high_risk_count
-        FROM `{self.table_path}`
-        WHERE timestamp >= TIMESTAMP(@period_start)
-          AND timestamp < TIMESTAMP(@period_end)
-          AND event_type = 'clause_analyzed'
-        GROUP BY category
-        ORDER BY count DESC
-        LIMIT 10
-        """
-        
-        cat_job = self.client.query(category_query, job_config=job_config)
-        cat_results = list(cat_job.result())
-        
-        top_categories = [
-            CategoryBreakdown(
-                category=row.category or "Unknown",
-                count=row.count,
-                avg_risk_score=row.avg_risk_score or 0.0,
-                high_risk_count=row.high_risk_count or 0
-            )
-            for row in cat_results
-        ]
+        top_categories = self._slice_top_categories(breakdown)
         
         return MetricsDetails(
             summary=summary,
@@ -1,12 +1,28 @@
 """
 Risk analysis service with LLM + keyword approach
 """
+import asyncio
+import bisect
+import functools
 import logging
 from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
 import re
 
+try:
+    # Optional accelerator: the keyword set is literal phrases, which an
+    # Aho-Corasick automaton finds in one linear pass of the text. That
+    # already gives this hot path a single-DFA scan, so a second native
+    # engine (e.g. Hyperscan, as used for the privacy fallback patterns)
+    # is not layered on top; the alternation regex stays as the portable
+    # fallback when pyahocorasick is not installed.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+import numpy as np
+
 from app.core.logging import get_logger, LogContext
 from app.models.document import RiskLevel
 
@@ -29,6 +45,29 @@ class RiskCategory(Enum):
     JURISDICTION = "jurisdiction"
 
 
+# Ordinal index per category, so hot loops can update a flat list instead
+# of hashing enum members into a dict; the tuple avoids re-iterating the
+# Enum metaclass on every clause
+_ALL_CATEGORIES = tuple(RiskCategory)
+_CATEGORY_INDEX = {category: index for index, category in enumerate(_ALL_CATEGORIES)}
+
+# Risk multiplier per clause category (0.8 to 1.2): inherently higher-risk
+# categories amplify the hybrid score, lower-risk ones damp it
+_CATEGORY_RISK_MULTIPLIERS = {
+    "Indemnity": 1.2,
+    "Liability": 1.15,
+    "Termination": 1.1,
+    "Assignment": 1.1,
+    "Payment": 1.0,
+    "Confidentiality": 1.0,
+    "IP Ownership": 1.05,
+    "Dispute Resolution": 1.05,
+    "Governing Law": 0.9,
+    "Modification": 0.95,
+    "Other": 0.9,
+}
+
+
 @dataclass
 class RiskKeyword:
     """Represents a risk-associated keyword with metadata."""
@@ -53,12 +92,349 @@ class RiskAssessment:
     explanation: str
 
 
+def _initialize_risk_keywords() -> List[RiskKeyword]:
+    """Initialize risk keywords from PROJECT_OUTLINE specifications."""
+    
+    keywords = [
+        # High-risk indemnification terms
+        RiskKeyword(
+            keyword="indemnify|indemnification|indemnities",
+            risk_weight=0.8,
+            categories=[RiskCategory.INDEMNITY],
+            requires_context=True,
+            negative_contexts=["mutual indemnification", "limited indemnification"]
+        ),
+        RiskKeyword(
+            keyword="hold harmless",
+            risk_weight=0.9,
+            categories=[RiskCategory.INDEMNITY, RiskCategory.LIABILITY]
+        ),
+        RiskKeyword(
+            keyword="defend",
+            risk_weight=0.7,
+            categories=[RiskCategory.INDEMNITY],
+            requires_context=True,
+            negative_contexts=["right to defend", "option to defend"]
+        ),
+        
+        # Unlimited liability terms
+        RiskKeyword(
+            keyword="unlimited",
+            risk_weight=0.95,
+            categories=[RiskCategory.LIABILITY]
+        ),
+        RiskKeyword(
+            keyword="without limit|no limit",
+            risk_weight=0.9,
+            categories=[RiskCategory.LIABILITY]
+        ),
+        RiskKeyword(
+            keyword="consequential damages",
+            risk_weight=0.8,
+            categories=[RiskCategory.LIABILITY],
+            negative_contexts=["excluding consequential", "no consequential"]
+        ),
+        RiskKeyword(
+            keyword="punitive damages",
+            risk_weight=0.85,
+            categories=[RiskCategory.LIABILITY],
+            negative_contexts=["excluding punitive", "no punitive"]
+        ),
+        
+        # Automatic renewal risks
+        RiskKeyword(
+            keyword="automatic renewal|auto-renewal|automatically renew",
+            risk_weight=0.7,
+            categories=[RiskCategory.AUTO_RENEWAL, RiskCategory.TERMINATION]
+        ),
+        RiskKeyword(
+            keyword="perpetual|in perpetuity",
+            risk_weight=0.9,
+            categories=[RiskCategory.TERMINATION, RiskCategory.AUTO_RENEWAL]
+        ),
+        RiskKeyword(
+            keyword="rolling basis|successive periods",
+            risk_weight=0.6,
+            categories=[RiskCategory.AUTO_RENEWAL]
+        ),
+        
+        # Termination risks
+        RiskKeyword(
+            keyword="terminate without cause|terminate for convenience",
+            risk_weight=0.8,
+            categories=[RiskCategory.TERMINATION]
+        ),
+        RiskKeyword(
+            keyword="immediate termination|terminate immediately",
+            risk_weight=0.7,
+            categories=[RiskCategory.TERMINATION]
+        ),
+        RiskKeyword(
+            keyword="sole discretion",
+            risk_weight=0.75,
+            categories=[RiskCategory.TERMINATION, RiskCategory.MODIFICATION]
+        ),
+        
+        # Payment risks
+        RiskKeyword(
+            keyword="liquidated damages",
+            risk_weight=0.8,
+            categories=[RiskCategory.PAYMENT, RiskCategory.LIABILITY]
+        ),
+        RiskKeyword(
+            keyword="penalty|penalties",
+            risk_weight=0.75,
+            categories=[RiskCategory.PAYMENT]
+        ),
+        RiskKeyword(
+            keyword="late fees|interest on overdue",
+            risk_weight=0.5,
+            categories=[RiskCategory.PAYMENT]
+        ),
+        
+        # Jurisdiction and legal risks
+        RiskKeyword(
+            keyword="exclusive jurisdiction",
+            risk_weight=0.7,
+            categories=[RiskCategory.JURISDICTION, RiskCategory.DISPUTE_RESOLUTION]
+        ),
+        RiskKeyword(
+            keyword="waive|waiver",
+            risk_weight=0.8,
+            categories=[RiskCategory.DISPUTE_RESOLUTION],
+            requires_context=True
+        ),
+        RiskKeyword(
+            keyword="jury trial waiver|waive jury trial",
+            risk_weight=0.85,
+            categories=[RiskCategory.DISPUTE_RESOLUTION]
+        ),
+        
+        # Assignment risks
+        RiskKeyword(
+            keyword="assignment without consent|assign without consent",
+            risk_weight=0.7,
+            categories=[RiskCategory.ASSIGNMENT]
+        ),
+        RiskKeyword(
+            keyword="freely assign|assign freely",
+            risk_weight=0.6,
+            categories=[RiskCategory.ASSIGNMENT]
+        ),
+        
+        # IP and confidentiality risks
+        RiskKeyword(
+            keyword="work for hire|work made for hire",
+            risk_weight=0.8,
+            categories=[RiskCategory.IP_OWNERSHIP]
+        ),
+        RiskKeyword(
+            keyword="all rights|exclusive rights",
+            risk_weight=0.7,
+            categories=[RiskCategory.IP_OWNERSHIP],
+            requires_context=True
+        ),
+        RiskKeyword(
+            keyword="perpetual confidentiality|indefinite confidentiality",
+            risk_weight=0.6,
+            categories=[RiskCategory.CONFIDENTIALITY]
+        ),
+        
+        # Modification risks
+        RiskKeyword(
+            keyword="unilateral|unilaterally",
+            risk_weight=0.75,
+            categories=[RiskCategory.MODIFICATION],
+            requires_context=True
+        ),
+        RiskKeyword(
+            keyword="at any time|without notice",
+            risk_weight=0.65,
+            categories=[RiskCategory.MODIFICATION, RiskCategory.TERMINATION],
+            requires_context=True
+        ),
+    ]
+    
+    return keywords
+
+
+def _compile_keyword_patterns(
+    risk_keywords: List[RiskKeyword],
+) -> Tuple[List[Tuple[RiskKeyword, re.Pattern]], Optional[re.Pattern], Dict[str, List[Tuple[str, str]]]]:
+    """Compile the keyword and negative-context patterns once.
+
+    Each keyword keeps its own compiled pattern and is scanned
+    independently: keywords from different entries may overlap in the text
+    (e.g. "waive" inside "waive jury trial"), and folding them into one
+    alternation would drop all but the first overlapping hit. Returns the
+    per-keyword patterns, the negative-context union, and the per-keyword
+    negative group names.
+    """
+    keyword_patterns = [
+        (risk_keyword, re.compile(rf'\b(?:{risk_keyword.keyword})\b', re.MULTILINE))
+        for risk_keyword in risk_keywords
+    ]
+    
+    # All negative-context phrases merge into one union scanned once per
+    # clause; each keyword keeps the ordered group names of its own
+    # phrases so the first triggered mitigation wins, as before. The
+    # text is lowercased a single time per clause, so none of these
+    # patterns pays per-character case folding
+    negative_phrases = []
+    negative_groups_by_keyword: Dict[str, List[Tuple[str, str]]] = {}
+    for risk_keyword in risk_keywords:
+        groups = []
+        for neg_context in (risk_keyword.negative_contexts or []):
+            group_name = f"n{len(negative_phrases)}"
+            negative_phrases.append(f"(?P<{group_name}>{neg_context.lower()})")
+            groups.append((group_name, neg_context.lower()))
+        negative_groups_by_keyword[risk_keyword.keyword] = groups
+    negative_union = (
+        re.compile("|".join(negative_phrases)) if negative_phrases else None
+    )
+    
+    return keyword_patterns, negative_union, negative_groups_by_keyword
+
+
+def _build_keyword_automaton(risk_keywords: List[RiskKeyword]):
+    """Build an Aho-Corasick automaton over the keyword literals, if available."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for risk_keyword in risk_keywords:
+        for literal in risk_keyword.keyword.split("|"):
+            automaton.add_word(literal.lower(), (risk_keyword.keyword, literal))
+    automaton.make_automaton()
+    return automaton
+
+
+# Keyword table and matching structures are immutable and identical for
+# every instance, so they are built once at import time
+_RISK_KEYWORDS = _initialize_risk_keywords()
+(
+    _KEYWORD_PATTERNS,
+    _NEGATIVE_UNION,
+    _NEGATIVE_GROUPS_BY_KEYWORD,
+) = _compile_keyword_patterns(_RISK_KEYWORDS)
+_KEYWORD_AUTOMATON = _build_keyword_automaton(_RISK_KEYWORDS)
+
+
+def _automaton_matches_regex(
+    automaton,
+    keyword_patterns: List[Tuple[RiskKeyword, re.Pattern]],
+) -> bool:
+    """Probe both matching engines for identical results.
+
+    Scoring must not depend on whether the optional pyahocorasick package
+    is installed, so the automaton is only used if it reproduces the
+    regex path's match sets on a probe covering overlapping keywords,
+    word boundaries, and multi-word literals.
+    """
+    if automaton is None:
+        return False
+    
+    probe = (
+        "the parties waive jury trial rights and hold harmless obligations; "
+        "perpetual confidentiality applies, no waivers, indemnify fully; "
+        "the waive jury trial waiver clause overlaps"
+    )
+    
+    # Hit order differs between the engines; compare sorted multisets
+    regex_hits = {
+        (risk_keyword.keyword, tuple(sorted(pattern.findall(probe))))
+        for risk_keyword, pattern in keyword_patterns
+        if pattern.search(probe)
+    }
+    
+    automaton_collected: Dict[str, List[str]] = {}
+    last_end_by_keyword: Dict[str, int] = {}
+    for end_index, (keyword, literal) in automaton.iter(probe):
+        start_index = end_index - len(literal) + 1
+        if start_index < last_end_by_keyword.get(keyword, 0):
+            continue
+        if start_index > 0 and (probe[start_index - 1].isalnum() or probe[start_index - 1] == "_"):
+            continue
+        if end_index + 1 < len(probe) and (probe[end_index + 1].isalnum() or probe[end_index + 1] == "_"):
+            continue
+        last_end_by_keyword[keyword] = end_index + 1
+        automaton_collected.setdefault(keyword, []).append(literal)
+    automaton_hits = {
+        (keyword, tuple(sorted(literals))) for keyword, literals in automaton_collected.items()
+    }
+    
+    if automaton_hits != regex_hits:
+        logger.warning(
+            "Aho-Corasick keyword matches diverge from the regex path; "
+            "falling back to regex matching"
+        )
+        return False
+    return True
+
+
+if not _automaton_matches_regex(_KEYWORD_AUTOMATON, _KEYWORD_PATTERNS):
+    _KEYWORD_AUTOMATON = None
+_KEYWORD_CATEGORY_INDICES = {
+    risk_keyword.keyword: [_CATEGORY_INDEX[c] for c in risk_keyword.categories]
+    for risk_keyword in _RISK_KEYWORDS
+}
+_FACTOR_MESSAGES = {
+    literal.lower(): f"High-risk keyword: {literal.lower()}"
+    for risk_keyword in _RISK_KEYWORDS
+    for literal in risk_keyword.keyword.split("|")
+}
+_MITIGATION_MESSAGES = {
+    neg_context.lower(): f"Mitigated: {neg_context.lower()}"
+    for risk_keyword in _RISK_KEYWORDS
+    for neg_context in (risk_keyword.negative_contexts or [])
+}
+
+
+@dataclass
+class RiskAssessmentBatch:
+    """Structure-of-arrays view over a batch of RiskAssessments.
+
+    The numeric fields live in contiguous arrays so document-level
+    aggregation is a pure vector reduction instead of per-object
+    attribute chasing.
+    """
+    scores: np.ndarray
+    levels: np.ndarray  # RiskLevel ordinals (value_int)
+    needs_review: np.ndarray
+
+    @classmethod
+    def from_assessments(cls, assessments: List[RiskAssessment]) -> "RiskAssessmentBatch":
+        """Pack the aggregation-relevant fields of assessments into arrays."""
+        total = len(assessments)
+        return cls(
+            scores=np.fromiter((a.risk_score for a in assessments), float, total),
+            levels=np.fromiter((a.risk_level.value_int for a in assessments), np.int8, total),
+            needs_review=np.fromiter((a.needs_review for a in assessments), bool, total),
+        )
+
+
 class RiskAnalyzer:
     """Service for analyzing legal clause risks using hybrid approach."""
     
     def __init__(self):
-        self.risk_keywords = self._initialize_risk_keywords()
-        self.compiled_patterns = self._compile_keyword_patterns()
+        # All matching structures are shared module-level constants; the
+        # constructor only binds them (FastAPI DI may build instances
+        # per request, so no compile work belongs here)
+        self.risk_keywords = _RISK_KEYWORDS
+        self.compiled_patterns = _KEYWORD_PATTERNS
+        self._negative_union = _NEGATIVE_UNION
+        self._negative_groups_by_keyword = _NEGATIVE_GROUPS_BY_KEYWORD
+        self._keyword_automaton = _KEYWORD_AUTOMATON
+        self._keyword_category_indices = _KEYWORD_CATEGORY_INDICES
+        self._factor_messages = _FACTOR_MESSAGES
+        self._mitigation_messages = _MITIGATION_MESSAGES
+        
+        # Boilerplate clauses (notices, governing law, severability) repeat
+        # across documents; the deterministic keyword pass is cached so
+        # repeats skip the scan entirely
+        self._keyword_assessment_cached = functools.lru_cache(maxsize=4096)(
+            self._compute_keyword_assessment
+        )
         
         # Risk level thresholds
         self.risk_thresholds = {
@@ -66,184 +442,50 @@ class RiskAnalyzer:
             "moderate": 0.6,
             "attention": 0.8
         }
-    
-    def _initialize_risk_keywords(self) -> List[RiskKeyword]:
-        """Initialize risk keywords from PROJECT_OUTLINE specifications."""
-        
-        keywords = [
-            # High-risk indemnification terms
-            RiskKeyword(
-                keyword="indemnify|indemnification|indemnities",
-                risk_weight=0.8,
-                categories=[RiskCategory.INDEMNITY],
-                requires_context=True,
-                negative_contexts=["mutual indemnification", "limited indemnification"]
-            ),
-            RiskKeyword(
-                keyword="hold harmless",
-                risk_weight=0.9,
-                categories=[RiskCategory.INDEMNITY, RiskCategory.LIABILITY]
-            ),
-            RiskKeyword(
-                keyword="defend",
-                risk_weight=0.7,
-                categories=[RiskCategory.INDEMNITY],
-                requires_context=True,
-                negative_contexts=["right to defend", "option to defend"]
-            ),
-            
-            # Unlimited liability terms
-            RiskKeyword(
-                keyword="unlimited",
-                risk_weight=0.95,
-                categories=[RiskCategory.LIABILITY]
-            ),
-            RiskKeyword(
-                keyword="without limit|no limit",
-                risk_weight=0.9,
-                categories=[RiskCategory.LIABILITY]
-            ),
-            RiskKeyword(
-                keyword="consequential damages",
-                risk_weight=0.8,
-                categories=[RiskCategory.LIABILITY],
-                negative_contexts=["excluding consequential", "no consequential"]
-            ),
-            RiskKeyword(
-                keyword="punitive damages",
-                risk_weight=0.85,
-                categories=[RiskCategory.LIABILITY],
-                negative_contexts=["excluding punitive", "no punitive"]
-            ),
-            
-            # Automatic renewal risks
-            RiskKeyword(
-                keyword="automatic renewal|auto-renewal|automatically renew",
-                risk_weight=0.7,
-                categories=[RiskCategory.AUTO_RENEWAL, RiskCategory.TERMINATION]
-            ),
-            RiskKeyword(
-                keyword="perpetual|in perpetuity",
-                risk_weight=0.9,
-                categories=[RiskCategory.TERMINATION, RiskCategory.AUTO_RENEWAL]
-            ),
-            RiskKeyword(
-                keyword="rolling basis|successive periods",
-                risk_weight=0.6,
-                categories=[RiskCategory.AUTO_RENEWAL]
-            ),
-            
-            # Termination risks
-            RiskKeyword(
-                keyword="terminate without cause|terminate for convenience",
-                risk_weight=0.8,
-                categories=[RiskCategory.TERMINATION]
-            ),
-            RiskKeyword(
-                keyword="immediate termination|terminate immediately",
-                risk_weight=0.7,
-                categories=[RiskCategory.TERMINATION]
-            ),
-            RiskKeyword(
-                keyword="sole discretion",
-                risk_weight=0.75,
-                categories=[RiskCategory.TERMINATION, RiskCategory.MODIFICATION]
-            ),
-            
-            # Payment risks
-            RiskKeyword(
-                keyword="liquidated damages",
-                risk_weight=0.8,
-                categories=[RiskCategory.PAYMENT, RiskCategory.LIABILITY]
-            ),
-            RiskKeyword(
-                keyword="penalty|penalties",
-                risk_weight=0.75,
-                categories=[RiskCategory.PAYMENT]
-            ),
-            RiskKeyword(
-                keyword="late fees|interest on overdue",
-                risk_weight=0.5,
-                categories=[RiskCategory.PAYMENT]
-            ),
-            
-            # Jurisdiction and legal risks
-            RiskKeyword(
-                keyword="exclusive jurisdiction",
-                risk_weight=0.7,
-                categories=[RiskCategory.JURISDICTION, RiskCategory.DISPUTE_RESOLUTION]
-            ),
-            RiskKeyword(
-                keyword="waive|waiver",
-                risk_weight=0.8,
-                categories=[RiskCategory.DISPUTE_RESOLUTION],
-                requires_context=True
-            ),
-            RiskKeyword(
-                keyword="jury trial waiver|waive jury trial",
-                risk_weight=0.85,
-                categories=[RiskCategory.DISPUTE_RESOLUTION]
-            ),
-            
-            # Assignment risks
-            RiskKeyword(
-                keyword="assignment without consent|assign without consent",
-                risk_weight=0.7,
-                categories=[RiskCategory.ASSIGNMENT]
-            ),
-            RiskKeyword(
-                keyword="freely assign|assign freely",
-                risk_weight=0.6,
-                categories=[RiskCategory.ASSIGNMENT]
-            ),
-            
-            # IP and confidentiality risks
-            RiskKeyword(
-                keyword="work for hire|work made for hire",
-                risk_weight=0.8,
-                categories=[RiskCategory.IP_OWNERSHIP]
-            ),
-            RiskKeyword(
-                keyword="all rights|exclusive rights",
-                risk_weight=0.7,
-                categories=[RiskCategory.IP_OWNERSHIP],
-                requires_context=True
-            ),
-            RiskKeyword(
-                keyword="perpetual confidentiality|indefinite confidentiality",
-                risk_weight=0.6,
-                categories=[RiskCategory.CONFIDENTIALITY]
-            ),
-            
-            # Modification risks
-            RiskKeyword(
-                keyword="unilateral|unilaterally",
-                risk_weight=0.75,
-                categories=[RiskCategory.MODIFICATION],
-                requires_context=True
-            ),
-            RiskKeyword(
-                keyword="at any time|without notice",
-                risk_weight=0.65,
-                categories=[RiskCategory.MODIFICATION, RiskCategory.TERMINATION],
-                requires_context=True
-            ),
-        ]
         
-        return keywords
+        # Sorted cutoffs for bisect-based level lookup; bisect_right keeps
+        # the >= semantics of the old branch ladder
+        self._level_cutoffs = (self.risk_thresholds["moderate"], self.risk_thresholds["attention"])
+        self._level_order = (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.ATTENTION)
     
-    def _compile_keyword_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for efficient keyword matching."""
-        patterns = {}
-        
-        for risk_keyword in self.risk_keywords:
-            pattern = re.compile(
-                rf'\b({risk_keyword.keyword})\b',
-                re.IGNORECASE | re.MULTILINE
-            )
-            patterns[risk_keyword.keyword] = pattern
-        
-        return patterns
+    def _collect_keyword_matches(self, text_lower: str) -> Dict[str, List[str]]:
+        """Collect keyword hits grouped by RiskKeyword.
+
+        Expects already-lowercased text; the keyword literals are lowercase,
+        so matching needs no case folding. Each keyword is matched
+        independently, so hits overlapping across keywords (e.g. "waive"
+        inside "waive jury trial") are all reported — the Aho-Corasick and
+        per-pattern paths produce the same match sets.
+        """
+        matches_by_keyword: Dict[str, List[str]] = {}
+        
+        if self._keyword_automaton is not None:
+            # Single automaton pass; word boundaries are enforced manually
+            # since Aho-Corasick matches raw substrings. The automaton also
+            # reports hits of one keyword's literals that overlap each other
+            # (e.g. both spans in "waive jury trial waiver"), which findall
+            # never does — drop any hit overlapping the previous kept span
+            # of the same keyword so both engines consume non-overlapping
+            # matches and scoring stays identical
+            length = len(text_lower)
+            last_end_by_keyword: Dict[str, int] = {}
+            for end_index, (keyword, literal) in self._keyword_automaton.iter(text_lower):
+                start_index = end_index - len(literal) + 1
+                if start_index < last_end_by_keyword.get(keyword, 0):
+                    continue
+                if start_index > 0 and (text_lower[start_index - 1].isalnum() or text_lower[start_index - 1] == "_"):
+                    continue
+                if end_index + 1 < length and (text_lower[end_index + 1].isalnum() or text_lower[end_index + 1] == "_"):
+                    continue
+                last_end_by_keyword[keyword] = end_index + 1
+                matches_by_keyword.setdefault(keyword, []).append(literal)
+            return matches_by_keyword
+        
+        for risk_keyword, pattern in self.compiled_patterns:
+            matches = pattern.findall(text_lower)
+            if matches:
+                matches_by_keyword[risk_keyword.keyword] = matches
+        return matches_by_keyword
     
     async def analyze_clause_risk(
         self, 
@@ -268,46 +510,87 @@ class RiskAnalyzer:
             logger.info("Analyzing clause risk")
             
             # Step 1: Keyword-based analysis
-            keyword_assessment = await self._analyze_keywords(clause_text, clause_summary)
-            
-            # Step 2: Parse LLM assessment
-            llm_assessment = self._parse_llm_assessment(llm_risk_assessment)
+            keyword_assessment = self._analyze_keywords(clause_text, clause_summary)
             
-            # Step 3: Hybrid scoring
-            hybrid_score = await self._calculate_hybrid_score(
-                keyword_assessment, llm_assessment, clause_category
+            # Steps 2-6: scoring, conflict detection, and explanation
+            assessment = self._assemble_assessment(
+                keyword_assessment, llm_risk_assessment, clause_category
             )
             
-            # Step 4: Determine final risk level
-            final_risk_level = self._determine_risk_level(hybrid_score)
-            
-            # Step 5: Conflict detection and review flagging
-            needs_review = await self._detect_conflicts(
-                keyword_assessment, llm_assessment, hybrid_score
-            )
-            
-            # Step 6: Generate explanation
-            explanation = await self._generate_risk_explanation(
-                keyword_assessment, llm_assessment, final_risk_level, needs_review
-            )
-            
-            assessment = RiskAssessment(
-                risk_level=final_risk_level,
-                confidence=self._calculate_confidence(keyword_assessment, llm_assessment),
-                risk_score=hybrid_score,
-                detected_keywords=keyword_assessment["detected_keywords"],
-                risk_factors=keyword_assessment["risk_factors"],
-                llm_assessment=llm_assessment,
-                keyword_assessment=keyword_assessment,
-                needs_review=needs_review,
-                explanation=explanation
-            )
-            
-            logger.info(f"Risk analysis complete: {final_risk_level.value} (score: {hybrid_score:.3f})")
+            logger.info(f"Risk analysis complete: {assessment.risk_level.value} (score: {assessment.risk_score:.3f})")
             
             return assessment
     
-    async def _analyze_keywords(
+    async def analyze_clauses(
+        self,
+        clause_data: List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+    ) -> List[RiskAssessment]:
+        """
+        Analyze a batch of clauses, parallelizing the keyword scans.
+        
+        The CPU-bound keyword passes run on worker threads via
+        asyncio.to_thread, so a multi-hundred-clause document does not
+        serialize its scans on the event loop.
+        
+        Args:
+            clause_data: Tuples of (clause_text, clause_summary,
+                llm_risk_assessment, clause_category)
+            
+        Returns:
+            One RiskAssessment per input clause, in order
+        """
+        keyword_assessments = await asyncio.gather(*[
+            asyncio.to_thread(self._analyze_keywords, clause_text, clause_summary)
+            for clause_text, clause_summary, _, _ in clause_data
+        ])
+        
+        return [
+            self._assemble_assessment(keyword_assessment, llm_risk_assessment, clause_category)
+            for (_, _, llm_risk_assessment, clause_category), keyword_assessment
+            in zip(clause_data, keyword_assessments)
+        ]
+    
+    def _assemble_assessment(
+        self,
+        keyword_assessment: Dict[str, Any],
+        llm_risk_assessment: Optional[str],
+        clause_category: Optional[str]
+    ) -> RiskAssessment:
+        """Combine a keyword assessment with the LLM view into a RiskAssessment."""
+        # Parse LLM assessment
+        llm_assessment = self._parse_llm_assessment(llm_risk_assessment)
+        
+        # Hybrid scoring
+        hybrid_score = self._calculate_hybrid_score(
+            keyword_assessment, llm_assessment, clause_category
+        )
+        
+        # Determine final risk level
+        final_risk_level = self._determine_risk_level(hybrid_score)
+        
+        # Conflict detection and review flagging
+        needs_review = self._detect_conflicts(
+            keyword_assessment, llm_assessment, hybrid_score
+        )
+        
+        # Generate explanation
+        explanation = self._generate_risk_explanation(
+            keyword_assessment, llm_assessment, final_risk_level, needs_review
+        )
+        
+        return RiskAssessment(
+            risk_level=final_risk_level,
+            confidence=self._calculate_confidence(keyword_assessment, llm_assessment),
+            risk_score=hybrid_score,
+            detected_keywords=keyword_assessment["detected_keywords"],
+            risk_factors=keyword_assessment["risk_factors"],
+            llm_assessment=llm_assessment,
+            keyword_assessment=keyword_assessment,
+            needs_review=needs_review,
+            explanation=explanation
+        )
+    
+    def _analyze_keywords(
         self, 
         clause_text: str, 
         clause_summary: Optional[str] = None
@@ -315,6 +598,9 @@ class RiskAnalyzer:
         """
         Analyze clause using keyword patterns.
         
+        Results come from an LRU cache keyed on the inputs; callers must
+        treat the returned dict as read-only.
+        
         Args:
             clause_text: Original clause text
             clause_summary: Optional summary text
@@ -322,52 +608,79 @@ class RiskAnalyzer:
         Returns:
             Keyword analysis results
         """
-        # Combine text sources for analysis
+        return self._keyword_assessment_cached(clause_text, clause_summary)
+    
+    def _compute_keyword_assessment(
+        self, 
+        clause_text: str, 
+        clause_summary: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the keyword scan for a clause (uncached)."""
+        # Combine text sources for analysis, lowercased once so every
+        # downstream scan runs without case folding
         analysis_text = clause_text
         if clause_summary:
             analysis_text += f"\n{clause_summary}"
+        analysis_text = analysis_text.lower()
         
-        detected_keywords = []
+        # Accumulate straight into a set; matches are already lowercase
+        detected_keywords: Set[str] = set()
+        match_count = 0
         risk_factors = []
-        category_scores = {category: 0.0 for category in RiskCategory}
+        category_scores = [0.0] * len(_ALL_CATEGORIES)
         total_risk_score = 0.0
         
+        # One pass over the text; hits are grouped per keyword afterwards.
+        # (This also supersedes the old per-pattern findall calls — presence
+        # tests and first-hit reads now come from the same single scan.)
+        matches_by_keyword = self._collect_keyword_matches(analysis_text)
+        
+        # One union pass collects every triggered mitigation up front,
+        # instead of re-searching the clause per matched keyword
+        triggered_mitigations: Set[str] = set()
+        if matches_by_keyword and self._negative_union is not None:
+            triggered_mitigations = {
+                match.lastgroup for match in self._negative_union.finditer(analysis_text)
+            }
+        
         for risk_keyword in self.risk_keywords:
-            pattern = self.compiled_patterns[risk_keyword.keyword]
-            matches = pattern.findall(analysis_text)
+            matches = matches_by_keyword.get(risk_keyword.keyword)
             
             if matches:
-                detected_keywords.extend([match.lower() if isinstance(match, str) else match[0].lower() for match in matches])
+                detected_keywords.update(matches)
+                match_count += len(matches)
                 
                 # Calculate context-adjusted risk score
                 keyword_risk = risk_keyword.risk_weight
                 
                 # Check for negative contexts that reduce risk
-                if risk_keyword.negative_contexts:
-                    for neg_context in risk_keyword.negative_contexts:
-                        if re.search(neg_context, analysis_text, re.IGNORECASE):
-                            keyword_risk *= 0.5  # Reduce risk by half
-                            risk_factors.append(f"Mitigated: {neg_context}")
-                            break
+                for group_name, neg_phrase in self._negative_groups_by_keyword[risk_keyword.keyword]:
+                    if group_name in triggered_mitigations:
+                        keyword_risk *= 0.5  # Reduce risk by half
+                        risk_factors.append(self._mitigation_messages[neg_phrase])
+                        break
                 
                 total_risk_score += keyword_risk
                 
                 # Add to category scores
-                for category in risk_keyword.categories:
-                    category_scores[category] = max(category_scores[category], keyword_risk)
+                for category_index in self._keyword_category_indices[risk_keyword.keyword]:
+                    if keyword_risk > category_scores[category_index]:
+                        category_scores[category_index] = keyword_risk
                 
-                risk_factors.append(f"High-risk keyword: {matches[0]}")
+                risk_factors.append(
+                    self._factor_messages.get(matches[0]) or f"High-risk keyword: {matches[0]}"
+                )
         
-        # Normalize total risk score
-        if detected_keywords:
-            total_risk_score = min(1.0, total_risk_score / len(detected_keywords))
+        # Normalize total risk score (by raw match count, as before)
+        if match_count:
+            total_risk_score = min(1.0, total_risk_score / match_count)
         
         return {
             "risk_score": total_risk_score,
-            "detected_keywords": list(set(detected_keywords)),
+            "detected_keywords": list(detected_keywords),
             "risk_factors": risk_factors,
-            "category_scores": category_scores,
-            "keyword_count": len(set(detected_keywords)),
+            "category_scores": dict(zip(_ALL_CATEGORIES, category_scores)),
+            "keyword_count": len(detected_keywords),
             "method": "keyword_analysis"
         }
     
@@ -406,7 +719,7 @@ class RiskAnalyzer:
             "method": "llm_assessment"
         }
     
-    async def _calculate_hybrid_score(
+    def _calculate_hybrid_score(
         self, 
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
@@ -456,34 +769,7 @@ class RiskAnalyzer:
         Returns:
             Risk multiplier (0.8 to 1.2)
         """
-        # Categories with inherently higher risk
-        high_risk_categories = {
-            "Indemnity": 1.2,
-            "Liability": 1.15,
-            "Termination": 1.1,
-            "Assignment": 1.1
-        }
-        
-        # Categories with moderate risk
-        moderate_risk_categories = {
-            "Payment": 1.0,
-            "Confidentiality": 1.0,
-            "IP Ownership": 1.05,
-            "Dispute Resolution": 1.05
-        }
-        
-        # Lower risk categories
-        low_risk_categories = {
-            "Governing Law": 0.9,
-            "Modification": 0.95,
-            "Other": 0.9
-        }
-        
-        return (
-            high_risk_categories.get(clause_category) or
-            moderate_risk_categories.get(clause_category) or
-            low_risk_categories.get(clause_category, 1.0)
-        )
+        return _CATEGORY_RISK_MULTIPLIERS.get(clause_category, 1.0)
     
     def _determine_risk_level(self, risk_score: float) -> RiskLevel:
         """
@@ -495,14 +781,9 @@ class RiskAnalyzer:
         Returns:
             Risk level enum
         """
-        if risk_score >= self.risk_thresholds["attention"]:
-            return RiskLevel.ATTENTION
-        elif risk_score >= self.risk_thresholds["moderate"]:
-            return RiskLevel.MODERATE
-        else:
-            return RiskLevel.LOW
+        return self._level_order[bisect.bisect_right(self._level_cutoffs, risk_score)]
     
-    async def _detect_conflicts(
+    def _detect_conflicts(
         self,
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
@@ -572,7 +853,7 @@ class RiskAnalyzer:
         
         return min(1.0, base_confidence)
     
-    async def _generate_risk_explanation(
+    def _generate_risk_explanation(
         self,
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
@@ -620,15 +901,18 @@ class RiskAnalyzer:
         
         return " ".join(explanation_parts)
     
-    async def analyze_document_risk_profile(
+    def analyze_document_risk_profile(
         self, 
-        clause_assessments: List[RiskAssessment]
+        clause_assessments: List[RiskAssessment],
+        batch: Optional[RiskAssessmentBatch] = None
     ) -> Dict[str, Any]:
         """
         Analyze overall risk profile for a document.
         
         Args:
             clause_assessments: List of individual clause assessments
+            batch: Optional pre-packed array view of the assessments;
+                built on the fly when not supplied
             
         Returns:
             Document-level risk analysis
@@ -643,34 +927,43 @@ class RiskAnalyzer:
                 "average_risk_score": 0.0
             }
         
-        # Calculate risk distribution
-        risk_distribution = {"low": 0, "moderate": 0, "attention": 0}
-        needs_review_count = 0
-        total_risk_score = 0.0
-        top_risks = []
-        
-        for assessment in clause_assessments:
-            risk_distribution[assessment.risk_level.value] += 1
-            total_risk_score += assessment.risk_score
-            
-            if assessment.needs_review:
-                needs_review_count += 1
-            
-            # Collect high-risk clauses for top risks
-            if assessment.risk_level == RiskLevel.ATTENTION:
-                top_risks.append({
-                    "risk_factors": assessment.risk_factors[:2],  # Top 2 factors
-                    "risk_score": assessment.risk_score,
-                    "keywords": assessment.detected_keywords[:3]  # Top 3 keywords
-                })
-        
-        # Sort top risks by score
-        top_risks.sort(key=lambda x: x["risk_score"], reverse=True)
-        top_risks = top_risks[:5]  # Keep top 5
+        # Pack the numeric fields into arrays once and reduce with NumPy;
+        # Python object access is limited to the few top-risk survivors
+        total = len(clause_assessments)
+        if batch is None:
+            batch = RiskAssessmentBatch.from_assessments(clause_assessments)
+        scores = batch.scores
+        levels = batch.levels
+        level_counts = np.bincount(levels, minlength=3)
+        
+        risk_distribution = {
+            "low": int(level_counts[0]),
+            "moderate": int(level_counts[1]),
+            "attention": int(level_counts[2]),
+        }
+        needs_review_count = int(batch.needs_review.sum())
+        total_risk_score = float(scores.sum())
+        
+        # Collect high-risk clauses for top risks: argpartition selects the
+        # five best in O(N), then only that handful is sorted and
+        # materialized into dicts
+        attention_indices = np.flatnonzero(levels == 2)
+        if len(attention_indices) > 5:
+            keep = np.argpartition(-scores[attention_indices], 5)[:5]
+            attention_indices = attention_indices[keep]
+        attention_indices = attention_indices[np.argsort(-scores[attention_indices])]
+        top_risks = [
+            {
+                "risk_factors": clause_assessments[i].risk_factors[:2],  # Top 2 factors
+                "risk_score": clause_assessments[i].risk_score,
+                "keywords": clause_assessments[i].detected_keywords[:3]  # Top 3 keywords
+            }
+            for i in attention_indices
+        ]
         
         # Determine overall risk level
-        attention_ratio = risk_distribution["attention"] / len(clause_assessments)
-        moderate_ratio = risk_distribution["moderate"] / len(clause_assessments)
+        attention_ratio = risk_distribution["attention"] / total
+        moderate_ratio = risk_distribution["moderate"] / total
         
         if attention_ratio >= 0.3:  # 30% or more high-risk clauses
             overall_risk = "attention"
@@ -0,0 +1,28 @@
+-- Migration: promote the hot JSON fields of event_data to first-class,
+-- clustered columns so dashboard queries get predicate pushdown and
+-- column-pruned scans instead of per-row JSON_VALUE parsing.
+--
+-- BigQuery cannot add clustering to an existing table in place, so the
+-- migration recreates the events table partitioned by day and clustered
+-- by (event_type, risk_level), backfilling the typed columns from the
+-- JSON payload. New rows get the typed columns at ingest time (see
+-- AnalyticsService, which now publishes them alongside event_data).
+--
+-- Run during a quiet window:
+--   bq query --use_legacy_sql=false < sql/events_typed_columns.sql
+-- then point the Pub/Sub BigQuery subscription at the new table and
+-- swap the names (or update the BIGQUERY_TABLE setting).
+
+CREATE TABLE IF NOT EXISTS `clausecompass.events_v2`
+PARTITION BY DATE(timestamp)
+CLUSTER BY event_type, risk_level
+AS
+SELECT
+    *,
+    JSON_VALUE(event_data, '$.risk_level') AS risk_level,
+    JSON_VALUE(event_data, '$.category') AS category,
+    CAST(JSON_VALUE(event_data, '$.risk_score') AS FLOAT64) AS risk_score,
+    CAST(JSON_VALUE(event_data, '$.processing_time_ms') AS INT64) AS processing_time_ms,
+    CAST(JSON_VALUE(event_data, '$.response_time_ms') AS INT64) AS response_time_ms,
+    CAST(JSON_VALUE(event_data, '$.answer_confidence') AS FLOAT64) AS answer_confidence
+FROM `clausecompass.events`;